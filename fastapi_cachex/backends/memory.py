@@ -29,15 +29,22 @@ class MemoryBackend(BaseCacheBackend):
     async context.
     """
 
-    def __init__(self, cleanup_interval: int = 60) -> None:
+    def __init__(
+        self,
+        cleanup_interval: int = 60,
+        max_entries: int | None = None,
+    ) -> None:
         """Initialize in-memory cache backend.
 
         Args:
             cleanup_interval: Interval in seconds between cleanup runs (default: 60)
+            max_entries: Maximum number of cached entries; when full, the
+                oldest inserted entry is evicted to make room (None = unbounded)
         """
         self.cache: dict[str, CacheItem] = {}
         self.lock = asyncio.Lock()
         self.cleanup_interval = cleanup_interval
+        self.max_entries = max_entries
         self._cleanup_task: asyncio.Task[None] | None = None
 
     def _ensure_cleanup_started(self) -> None:
@@ -98,6 +105,21 @@ class MemoryBackend(BaseCacheBackend):
             ttl: Time to live in seconds (None = never expires)
         """
         async with self.lock:
+            if (
+                self.max_entries is not None
+                and key not in self.cache
+                and len(self.cache) >= self.max_entries
+            ):
+                # Bound memory by dropping the oldest inserted entry (O(1)
+                # thanks to dict insertion order); expired entries are removed
+                # separately by the cleanup task.
+                oldest_key = next(iter(self.cache))
+                del self.cache[oldest_key]
+                logger.debug(
+                    "Memory cache EVICT; key=%s max_entries=%s",
+                    oldest_key,
+                    self.max_entries,
+                )
             expiry = time.time() + ttl if ttl is not None else None
             self.cache[key] = CacheItem(value=value, expiry=expiry)
             logger.debug("Memory cache SET; key=%s ttl=%s", key, ttl)
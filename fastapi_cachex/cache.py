@@ -51,11 +51,19 @@ def default_key_builder(request: Request) -> str:
     Returns:
         Generated cache key string
     """
-    key = (
-        f"{request.method}{CACHE_KEY_SEPARATOR}"
-        f"{request.headers.get('host', 'unknown')}{CACHE_KEY_SEPARATOR}"
-        f"{request.url.path}{CACHE_KEY_SEPARATOR}"
-        f"{request.query_params}"
+    # Do not sys.intern() the key: it embeds the raw, attacker-controlled
+    # query string, and on CPython 3.12 interned strings are immortal, so
+    # every unique key would leak for the life of the process.
+    key = CACHE_KEY_SEPARATOR.join(
+        (
+            request.method,
+            request.headers.get("host", "unknown"),
+            request.url.path,
+            # The raw query string; str(request.query_params) would
+            # re-encode every key/value pair on each call for the same
+            # result.
+            request.url.query,
+        )
     )
     logger.debug("Built cache key: %s", key)
     return key
@@ -128,6 +136,16 @@ def _get_response_body(response: Response) -> bytes | None:
     return getattr(response, "body", None)
 
 
+def _make_etag(body: bytes) -> str:
+    """Build a weak ETag for a response body.
+
+    ETags are opaque identifiers (RFC 7232), so cryptographic strength is not
+    required; BLAKE2b hashes response bodies faster than MD5 and a 16-byte
+    digest keeps the header short.
+    """
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
 async def get_response(
     __func: HandlerCallable,
     __request: Request,
@@ -275,14 +293,6 @@ def cache(
 
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Response:
-            # Resolve backend on every request to support lifespan-configured backends
-            try:
-                cache_backend = BackendProxy.get()
-            except BackendNotFoundError:
-                cache_backend = MemoryBackend()
-                BackendProxy.set(cache_backend)
-                logger.debug("No backend configured; using MemoryBackend fallback")
-
             if found_request:
                 req: Request | None = kwargs.get(request_name)
             else:
@@ -292,13 +302,22 @@ def cache(
                 # Skip coverage for this case, as it should not happen
                 raise RequestNotFoundError
 
-            # Only cache GET requests
+            # Only cache GET requests; bail out before resolving the backend
+            # or building a cache key so writes pay no cache overhead
             if req.method != "GET":
                 logger.debug(
                     "Non-GET request; bypassing cache for method=%s", req.method
                 )
                 return await get_response(func, req, *args, **kwargs)
 
+            # Resolve backend on every request to support lifespan-configured backends
+            try:
+                cache_backend = BackendProxy.get()
+            except BackendNotFoundError:
+                cache_backend = MemoryBackend()
+                BackendProxy.set(cache_backend)
+                logger.debug("No backend configured; using MemoryBackend fallback")
+
             # Generate cache key using custom builder or default
             builder = key_builder or default_key_builder
             cache_key = builder(req)
@@ -330,7 +349,7 @@ def cache(
                         # StreamingResponse/FileResponse — cannot compute ETag; serve as-is
                         current_response.headers["Cache-Control"] = cache_control
                         return current_response
-                    current_etag = f'W/"{hashlib.md5(current_body).hexdigest()}"'  # noqa: S324
+                    current_etag = _make_etag(current_body)
 
                     if client_etag == current_etag:
                         # For no-cache, compare fresh data with client's ETag
@@ -381,7 +400,7 @@ def cache(
                     # StreamingResponse/FileResponse — cannot compute ETag; serve as-is
                     current_response.headers["Cache-Control"] = cache_control
                     return current_response
-                current_etag = f'W/"{hashlib.md5(current_body).hexdigest()}"'  # noqa: S324
+                current_etag = _make_etag(current_body)
                 logger.debug("Cache MISS; computed fresh ETag for key=%s", cache_key)
 
             # Set ETag header
@@ -6,6 +6,8 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 from typing import Any
 
+from fastapi import APIRouter
+
 from .backends import BaseCacheBackend
 from .exceptions import BackendNotFoundError
 from .proxy import BackendProxy
@@ -14,9 +16,8 @@ from .types import CACHE_KEY_SEPARATOR
 if TYPE_CHECKING:
     from fastapi import FastAPI
 
-# Constants
-CACHE_KEY_MIN_PARTS = 3
-CACHE_KEY_MAX_PARTS = 3
+# Length of the separator between cache key components
+_SEP_LEN = len(CACHE_KEY_SEPARATOR)
 
 
 @dataclass
@@ -99,15 +100,26 @@ def _parse_cache_key(cache_key: str) -> tuple[str, str, str, str]:
         cache_key: Cache key in format method|||host|||path|||query_params
 
     Returns:
-        Tuple of (method, host, path, query_params)
+        Tuple of (method, host, path, query_params); empty strings if the key
+        does not follow the expected format
     """
-    key_parts = cache_key.split(CACHE_KEY_SEPARATOR, CACHE_KEY_MAX_PARTS)
-    if len(key_parts) >= CACHE_KEY_MIN_PARTS:
-        method, host, path = key_parts[0], key_parts[1], key_parts[2]
-        query_params = key_parts[3] if len(key_parts) > CACHE_KEY_MIN_PARTS else ""
-        return method, host, path, query_params
-
-    return "", "", "", ""
+    # Slice out components with successive find() calls instead of split(),
+    # which would allocate a list plus one substring per part.
+    a = cache_key.find(CACHE_KEY_SEPARATOR)
+    if a < 0:
+        return "", "", "", ""
+    b = cache_key.find(CACHE_KEY_SEPARATOR, a + _SEP_LEN)
+    if b < 0:
+        return "", "", "", ""
+    c = cache_key.find(CACHE_KEY_SEPARATOR, b + _SEP_LEN)
+    if c < 0:
+        return cache_key[:a], cache_key[a + _SEP_LEN : b], cache_key[b + _SEP_LEN :], ""
+    return (
+        cache_key[:a],
+        cache_key[a + _SEP_LEN : b],
+        cache_key[b + _SEP_LEN : c],
+        cache_key[c + _SEP_LEN :],
+    )
 
 
 async def _get_cached_hits_handler(backend: BaseCacheBackend) -> CacheHitsResponse:
@@ -234,6 +246,69 @@ async def _get_cached_records_handler(
     )
 
 
+# The monitoring routes are prefix-independent, so the router is built once at
+# import time; add_routes() only has to include it with the caller's options.
+_monitoring_router = APIRouter()
+
+
+@_monitoring_router.get("/cached-hits")
+async def get_cached_hits() -> CacheHitsResponse:
+    """Return cached hit records.
+
+    Shows cache statistics including which routes are frequently being cached,
+    hit counts, and cache key information.
+
+    Returns:
+        CacheHitsResponse containing cache hit records and statistics
+    """
+    try:
+        backend: BaseCacheBackend = BackendProxy.get()
+    except BackendNotFoundError:
+        return CacheHitsResponse(
+            cached_hits=[],
+            total_hits=0,
+            valid_hits=0,
+            expired_hits=0,
+            unique_routes=0,
+            summary=CacheHitSummary(
+                total_cached_entries=0,
+                active_entries=0,
+                cached_paths=[],
+            ),
+        )
+
+    return await _get_cached_hits_handler(backend)
+
+
+@_monitoring_router.get("/cached-records")
+async def get_cached_records() -> CachedRecordsResponse:
+    """Display currently cached records.
+
+    Returns all currently cached records in the cache backend with their
+    content information and expiry details.
+
+    Returns:
+        CachedRecordsResponse containing cached records and statistics
+    """
+    try:
+        backend: BaseCacheBackend = BackendProxy.get()
+    except BackendNotFoundError:
+        return CachedRecordsResponse(
+            cached_records=[],
+            total_records=0,
+            active_records=0,
+            expired_records=0,
+            total_cache_size_bytes=0,
+            summary=CacheSummary(
+                total_entries=0,
+                valid_entries=0,
+                estimated_cache_size_kb=0.0,
+            ),
+        )
+
+    return await _get_cached_records_handler(backend)
+
+
 def add_routes(
     app: "FastAPI",
     prefix: str = "",
@@ -267,67 +342,9 @@ def add_routes(
         # Or with prefix
         add_routes(app, prefix="/api/cache")  # Routes at /api/cache/cached-hits and /api/cache/cached-records
     """
-
-    @app.get(
-        f"{prefix}/cached-hits",
+    app.include_router(
+        _monitoring_router,
+        prefix=prefix,
         include_in_schema=include_in_schema,
         dependencies=dependencies,
     )
-    async def get_cached_hits() -> CacheHitsResponse:
-        """Return cached hit records.
-
-        Shows cache statistics including which routes are frequently being cached,
-        hit counts, and cache key information.
-
-        Returns:
-            CacheHitsResponse containing cache hit records and statistics
-        """
-        try:
-            backend: BaseCacheBackend = BackendProxy.get()
-        except BackendNotFoundError:
-            return CacheHitsResponse(
-                cached_hits=[],
-                total_hits=0,
-                valid_hits=0,
-                expired_hits=0,
-                unique_routes=0,
-                summary=CacheHitSummary(
-                    total_cached_entries=0,
-                    active_entries=0,
-                    cached_paths=[],
-                ),
-            )
-
-        return await _get_cached_hits_handler(backend)
-
-    @app.get(
-        f"{prefix}/cached-records",
-        include_in_schema=include_in_schema,
-        dependencies=dependencies,
-    )
-    async def get_cached_records() -> CachedRecordsResponse:
-        """Display currently cached records.
-
-        Returns all currently cached records in the cache backend with their
-        content information and expiry details.
-
-        Returns:
-            CachedRecordsResponse containing cached records and statistics
-        """
-        try:
-            backend: BaseCacheBackend = BackendProxy.get()
-        except BackendNotFoundError:
-            return CachedRecordsResponse(
-                cached_records=[],
-                total_records=0,
-                active_records=0,
-                expired_records=0,
-                total_cache_size_bytes=0,
-                summary=CacheSummary(
-                    total_entries=0,
-                    valid_entries=0,
-                    estimated_cache_size_kb=0.0,
-                ),
-            )
-
-        return await _get_cached_records_handler(backend)
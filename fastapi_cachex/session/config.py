@@ -52,6 +52,14 @@ class SessionConfig(BaseModel):
         default=["header", "bearer"],
         description="Priority order for token sources",
     )
+    token_cache_size: int = Field(
+        default=0,
+        ge=0,
+        description="Max entries for the in-process validated-token cache "
+        "(0 disables it). Repeated requests with the same token skip the "
+        "backend lookup and signature verification; last-accessed freshness "
+        "is relaxed for cached hits",
+    )
 
     # JWT settings (used when token_format == 'jwt')
     jwt_algorithm: str = Field(
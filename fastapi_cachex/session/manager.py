@@ -1,6 +1,7 @@
 """Session manager for CRUD operations."""
 
 import logging
+from collections import OrderedDict
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
@@ -55,6 +56,11 @@ class SessionManager:
         else:
             self._serializer = SimpleTokenSerializer()
         logger.debug("Token serializer: %s", type(self._serializer).__name__)
+        # In-process LRU of validated tokens (opt-in via config.token_cache_size).
+        # Only positive, non-renewed results are cached; see get_session().
+        self._token_cache: OrderedDict[
+            tuple[str, str | None, str | None], Session
+        ] = OrderedDict()
         logger.debug(
             "SessionManager initialized with backend prefix=%s",
             config.backend_key_prefix,
@@ -187,6 +193,20 @@ class SessionManager:
             SessionInvalidError: If session is not active
             SessionSecurityError: If security checks fail
         """
+        # Fast path: previously validated token (opt-in, see token_cache_size)
+        cache_key = (token_string, ip_address, user_agent)
+        if self.config.token_cache_size:
+            cached = self._token_cache.get(cache_key)
+            if cached is not None:
+                if self._is_cached_session_usable(cached):
+                    self._token_cache.move_to_end(cache_key)
+                    logger.debug(
+                        "Session token cache HIT; id=%s", cached.session_id
+                    )
+                    return cached, None
+                # Expired / needs renewal: evict and take the slow path
+                del self._token_cache[cache_key]
+
         # Parse and verify token
         try:
             token = self._serializer.from_string(token_string)
@@ -275,28 +295,81 @@ class SessionManager:
         session.update_last_accessed()
 
         renewed_token: str | None = None
-        if self.config.sliding_expiration and session.expires_at:
-            time_remaining = (
-                session.expires_at - datetime.now(timezone.utc)
-            ).total_seconds()
-            threshold = self.config.session_ttl * self.config.sliding_threshold
-
-            if time_remaining < threshold:
-                session.renew(self.config.session_ttl)
-                token = self._create_token(
-                    session.session_id, expires_at=session.expires_at
-                )
-                renewed_token = self._serializer.to_string(token)
-                logger.debug(
-                    "Session renewed (sliding expiration); id=%s ttl=%s",
-                    session.session_id,
-                    self.config.session_ttl,
-                )
+        if self._within_sliding_threshold(session):
+            session.renew(self.config.session_ttl)
+            token = self._create_token(
+                session.session_id, expires_at=session.expires_at
+            )
+            renewed_token = self._serializer.to_string(token)
+            logger.debug(
+                "Session renewed (sliding expiration); id=%s ttl=%s",
+                session.session_id,
+                self.config.session_ttl,
+            )
 
         await self._save_session(session)
 
+        # Cache only positive, non-renewed results: after a renewal the client
+        # switches to the new token, so caching the old one would be wasted.
+        if self.config.token_cache_size and renewed_token is None:
+            self._token_cache[cache_key] = session
+            if len(self._token_cache) > self.config.token_cache_size:
+                self._token_cache.popitem(last=False)
+
         return session, renewed_token
 
+    def _within_sliding_threshold(self, session: Session) -> bool:
+        """Check whether sliding expiration should renew the session.
+
+        Args:
+            session: Session to check
+
+        Returns:
+            True if the remaining lifetime is below the sliding threshold
+        """
+        if not (self.config.sliding_expiration and session.expires_at):
+            return False
+        time_remaining = (
+            session.expires_at - datetime.now(timezone.utc)
+        ).total_seconds()
+        return time_remaining < self.config.session_ttl * self.config.sliding_threshold
+
+    def _is_cached_session_usable(self, session: Session) -> bool:
+        """Check whether a token-cache entry can be served without the backend.
+
+        Args:
+            session: Cached session
+
+        Returns:
+            True if the session is still active, unexpired (including the
+            absolute timeout) and does not need a sliding renewal
+        """
+        if session.status != SessionStatus.ACTIVE or session.is_expired():
+            return False
+        if self.config.absolute_timeout is not None:
+            absolute_expires_at = session.created_at + timedelta(
+                seconds=self.config.absolute_timeout,
+            )
+            if datetime.now(timezone.utc) >= absolute_expires_at:
+                return False
+        return not self._within_sliding_threshold(session)
+
+    def _evict_cached_session(self, session_id: str) -> None:
+        """Drop token-cache entries referencing a session.
+
+        Args:
+            session_id: Session ID whose cached tokens should be evicted
+        """
+        if not self._token_cache:
+            return
+        stale = [
+            key
+            for key, cached in self._token_cache.items()
+            if cached.session_id == session_id
+        ]
+        for key in stale:
+            del self._token_cache[key]
+
     async def update_session(self, session: Session) -> None:
         """Update an existing session.
 
@@ -315,6 +388,7 @@ class SessionManager:
         """
         key = self._get_backend_key(session_id)
         await self.backend.delete(key)
+        self._evict_cached_session(session_id)
         logger.debug("Session deleted; id=%s", session_id)
 
     async def invalidate_session(self, session: Session) -> None:
@@ -325,6 +399,7 @@ class SessionManager:
         """
         session.invalidate()
         await self._save_session(session)
+        self._evict_cached_session(session.session_id)
         logger.debug("Session invalidated; id=%s", session.session_id)
 
     async def regenerate_session_id(
@@ -376,6 +451,7 @@ class SessionManager:
                     session = await self._load_session_by_key(key)
                     if session and session.user and session.user.user_id == user_id:
                         await self.backend.delete(key)
+                        self._evict_cached_session(session.session_id)
                         count += 1
         except NotImplementedError:  # pragma: no cover
             # Backend doesn't support get_all_keys, can't delete by user
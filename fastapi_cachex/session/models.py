@@ -1,6 +1,7 @@
 """Session data models and user structures."""
 
 import logging
+import time
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
@@ -10,9 +11,14 @@ from uuid import uuid4
 
 from pydantic import BaseModel
 from pydantic import Field
+from pydantic import PrivateAttr
 
 logger = logging.getLogger(__name__)
 
+# Current time as an epoch float: cheaper than datetime.now(tz) on the
+# per-request expiry checks (no datetime allocation / tzinfo dispatch).
+_now_ts = time.time
+
 
 class SessionStatus(str, Enum):
     """Session status enumeration."""
@@ -31,8 +37,10 @@ class SessionUser(BaseModel):
     user_id: str
     username: str | None = None
     email: str | None = None
-    roles: list[str] = Field(default_factory=list)
-    permissions: list[str] = Field(default_factory=list)
+    # Immutable defaults share one empty tuple instead of allocating two lists
+    # per user on every request.
+    roles: tuple[str, ...] = ()
+    permissions: tuple[str, ...] = ()
     metadata: dict[str, Any] = Field(default_factory=dict)
 
     model_config = {"extra": "allow"}
@@ -54,31 +62,50 @@ class Session(BaseModel):
 
     model_config = {"use_enum_values": True}
 
+    # Cached (expires_at, epoch seconds) pair; keyed on the datetime's identity
+    # so direct `session.expires_at = ...` assignments invalidate it naturally.
+    _expires_cache: tuple[datetime, float] | None = PrivateAttr(default=None)
+
+    def _expires_ts(self) -> float | None:
+        """Return `expires_at` as epoch seconds, caching the conversion."""
+        expires_at = self.expires_at
+        if expires_at is None:
+            return None
+        cached = self._expires_cache
+        if cached is None or cached[0] is not expires_at:
+            cached = (expires_at, expires_at.timestamp())
+            self._expires_cache = cached
+        return cached[1]
+
     def is_valid(self) -> bool:
         """Check if session is valid (active and not expired)."""
         if self.status != SessionStatus.ACTIVE:
             return False
 
-        return not (self.expires_at and datetime.now(timezone.utc) > self.expires_at)
+        expires_ts = self._expires_ts()
+        return expires_ts is None or _now_ts() <= expires_ts
 
     def is_expired(self) -> bool:
         """Check if session has expired."""
-        if self.expires_at is None:
-            return False
-        return datetime.now(timezone.utc) > self.expires_at
+        expires_ts = self._expires_ts()
+        return expires_ts is not None and _now_ts() > expires_ts
 
     def update_last_accessed(self) -> None:
         """Update the last accessed timestamp."""
         self.last_accessed = datetime.now(timezone.utc)
         logger.debug("Session last_accessed updated; id=%s", self.session_id)
 
-    def renew(self, ttl: int) -> None:
+    def renew(self, ttl: int, now: datetime | None = None) -> None:
         """Renew session expiry time.
 
         Args:
             ttl: Time-to-live in seconds
+            now: Reference time for the renewal (defaults to the current UTC
+                time; injectable for testing)
         """
-        self.expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl)
+        if now is None:
+            now = datetime.now(timezone.utc)
+        self.expires_at = now + timedelta(seconds=ttl)
         self.update_last_accessed()
         logger.debug("Session renewed; id=%s ttl=%s", self.session_id, ttl)
 
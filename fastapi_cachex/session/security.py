@@ -27,34 +27,52 @@ class SecurityManager:
             "SecurityManager initialized with secret length=%s", len(secret_key)
         )
 
-    def sign_session_id(self, session_id: str) -> str:
-        """Sign a session ID using HMAC-SHA256.
+    def _sign_bytes(self, session_id: str) -> bytes:
+        """Sign a session ID, returning the raw HMAC-SHA256 digest.
 
         Args:
             session_id: The session ID to sign
 
         Returns:
-            The signature as a hex string
+            The 32-byte raw digest
         """
         return hmac.new(
             self._secret_key_bytes,
             session_id.encode("utf-8"),
             hashlib.sha256,
-        ).hexdigest()
+        ).digest()
+
+    def sign_session_id(self, session_id: str) -> str:
+        """Sign a session ID using HMAC-SHA256.
+
+        Args:
+            session_id: The session ID to sign
+
+        Returns:
+            The signature as a hex string
+        """
+        return self._sign_bytes(session_id).hex()
 
     def verify_signature(self, session_id: str, signature: str) -> bool:
         """Verify a session signature.
 
         Args:
             session_id: The session ID
-            signature: The signature to verify
+            signature: The signature to verify (hex string)
 
         Returns:
             True if signature is valid, False otherwise
         """
-        expected_signature = self.sign_session_id(session_id)
-        # Use constant-time comparison to prevent timing attacks
-        valid = hmac.compare_digest(expected_signature, signature)
+        try:
+            provided = bytes.fromhex(signature)
+        except ValueError:
+            # Not a hex string at all; cannot be a valid signature
+            logger.debug("Signature verification failed; id=%s", session_id)
+            return False
+
+        # Constant-time comparison (on the raw 32-byte digests, which is half
+        # the work of comparing their 64-char hex forms) to prevent timing attacks
+        valid = hmac.compare_digest(self._sign_bytes(session_id), provided)
 
         if not valid:
             logger.debug("Signature verification failed; id=%s", session_id)
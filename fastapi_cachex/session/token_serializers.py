@@ -127,6 +127,30 @@ class JWTTokenSerializer:
         self._leeway = config.jwt_leeway
         self._session_ttl = config.session_ttl
 
+        # Precompute the static parts of the encode payload and decode kwargs
+        # once; to_string/from_string only fill in the per-token claims.
+        self._payload_template: dict[str, object] = {}
+        if self._issuer:
+            self._payload_template["iss"] = self._issuer
+        if self._audience:
+            self._payload_template["aud"] = self._audience
+
+        self._decode_kwargs: dict[str, object] = {
+            "algorithms": [self._algorithm],
+            "options": {
+                "require": ["sid", "iat", "exp"],
+                "verify_signature": True,
+                "verify_exp": True,
+                "verify_iat": True,
+            },
+            "leeway": self._leeway,
+            "key": self._secret,
+        }
+        if self._issuer:
+            self._decode_kwargs["issuer"] = self._issuer
+        if self._audience:
+            self._decode_kwargs["audience"] = self._audience
+
     def to_string(self, token: SessionToken) -> str:
         """Encode a `SessionToken` as a signed JWT string.
 
@@ -139,15 +163,10 @@ class JWTTokenSerializer:
         else:
             exp = iat + int(self._session_ttl)
 
-        payload: dict[str, object] = {
-            "sid": token.session_id,
-            "iat": iat,
-            "exp": exp,
-        }
-        if self._issuer:
-            payload["iss"] = self._issuer
-        if self._audience:
-            payload["aud"] = self._audience
+        payload = self._payload_template.copy()
+        payload["sid"] = token.session_id
+        payload["iat"] = iat
+        payload["exp"] = exp
 
         encoded = self.jwt_encoder.encode(
             payload, self._secret, algorithm=self._algorithm
@@ -161,27 +180,8 @@ class JWTTokenSerializer:
 
         Verifies signature, `exp`, and `iat`, and optional `iss`/`aud`.
         """
-        options = {
-            "require": ["sid", "iat", "exp"],
-            "verify_signature": True,
-            "verify_exp": True,
-            "verify_iat": True,
-        }
-
-        kwargs: dict[str, object] = {
-            "algorithms": [self._algorithm],
-            "options": options,
-            "leeway": self._leeway,
-            "key": self._secret,
-        }
-
-        if self._issuer:
-            kwargs["issuer"] = self._issuer
-        if self._audience:
-            kwargs["audience"] = self._audience
-
         try:
-            payload = self.jwt_encoder.decode(token_str, **kwargs)
+            payload = self.jwt_encoder.decode(token_str, **self._decode_kwargs)
         except Exception as e:  # Broad catch to normalize to ValueError
             logger.debug("JWT decode failed: %s", e)
             msg = "Invalid JWT token"
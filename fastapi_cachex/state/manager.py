@@ -23,6 +23,9 @@ logger = logging.getLogger(__name__)
 # Default TTL for OAuth state (10 minutes)
 DEFAULT_STATE_TTL = 600
 
+# Default prefix for state keys in the cache backend
+DEFAULT_KEY_PREFIX = "oauth_state:"
+
 
 class StateManager:
     """Manages OAuth state and session state lifecycle and storage."""
@@ -30,7 +33,7 @@ class StateManager:
     def __init__(
         self,
         backend: BaseCacheBackend | None = None,
-        key_prefix: str = "oauth_state:",
+        key_prefix: str = DEFAULT_KEY_PREFIX,
         default_ttl: int = DEFAULT_STATE_TTL,
     ) -> None:
         """Initialize StateManager.
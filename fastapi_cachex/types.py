@@ -8,20 +8,28 @@ from fastapi import Request
 # Cache key separator - using ||| to avoid conflicts with port numbers in host (e.g., 127.0.0.1:8000)
 CACHE_KEY_SEPARATOR = "|||"
 
+# The separator must never collide with characters that legitimately appear in
+# the method/host/path/query components; guard that invariant at import time.
+assert not set(CACHE_KEY_SEPARATOR) & set(":/?&")
+
 # Type for custom cache key builder function
 CacheKeyBuilder = Callable[[Request], str]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CacheEntry:
-    """Cache entry storing a fingerprint, raw content bytes, and an optional media type."""
+    """Cache entry storing a fingerprint, raw content bytes, and an optional media type.
+
+    Frozen and slotted: entries are written once on a cache miss and then only
+    read on the hit path, so they need no per-instance ``__dict__``.
+    """
 
     fingerprint: str
     content: bytes
     media_type: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CacheItem:
     """Cache item with optional expiry time.
 
@@ -89,6 +89,29 @@ async def test_memory_backend_clear(memory_backend: MemoryBackend):
     assert retrieved_value2 is None
 
 
+@pytest.mark.asyncio
+async def test_memory_backend_max_entries_evicts_oldest():
+    """When max_entries is reached, the oldest inserted entry is evicted."""
+    backend = MemoryBackend(max_entries=2)
+    value1 = CacheEntry(fingerprint="e1", content=b"v1")
+    value2 = CacheEntry(fingerprint="e2", content=b"v2")
+    value3 = CacheEntry(fingerprint="e3", content=b"v3")
+
+    await backend.set("key1", value1)
+    await backend.set("key2", value2)
+    await backend.set("key3", value3)  # Evicts key1
+
+    assert await backend.get("key1") is None
+    assert await backend.get("key2") == value2
+    assert await backend.get("key3") == value3
+    assert len(backend.cache) == 2
+
+    # Overwriting an existing key must not evict anything
+    await backend.set("key2", value1)
+    assert await backend.get("key3") == value3
+    assert len(backend.cache) == 2
+
+
 @pytest.mark.asyncio
 async def test_memory_backend_ttl_expiry(memory_backend: MemoryBackend):
     key = "test_key"
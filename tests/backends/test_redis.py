@@ -1,5 +1,4 @@
 import asyncio
-import socket
 import sys
 from collections.abc import AsyncGenerator
 from typing import Any
@@ -10,41 +9,12 @@ import pytest_asyncio
 from fastapi_cachex.backends import AsyncRedisCacheBackend
 from fastapi_cachex.exceptions import CacheXError
 from fastapi_cachex.types import CacheEntry
+from tests.conftest import is_redis_running
+from tests.conftest import requires_redis
+from tests.conftest import requires_redis_package
 
 
-def is_redis_running(host: str = "127.0.0.1", port: int = 6379) -> bool:
-    """Check if Redis server is running."""
-    try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        s.settimeout(1.0)
-        s.connect((host, port))
-        s.close()
-    except TimeoutError:
-        return False
-    else:
-        return True
-
-
-requires_redis = pytest.mark.skipif(
-    not is_redis_running(),
-    reason="Redis server is not running",
-)
-
-
-def has_redis_package() -> bool:
-    """Return True if the `redis` package is importable."""
-    try:
-        import redis.asyncio  # type: ignore[unused-ignore]  # noqa: F401
-
-    except Exception:
-        return False
-    return True
-
-
-@pytest.mark.skipif(
-    not has_redis_package(),
-    reason="redis package is not installed",
-)
+@requires_redis_package
 def test_redis_load_from_config_initializes_client_and_prefix() -> None:
     """Ensure `load_from_config` builds a backend with expected settings."""
     from pydantic import SecretStr
@@ -73,10 +43,7 @@ def test_redis_load_from_config_initializes_client_and_prefix() -> None:
         assert hasattr(backend.client, "connection_pool")
 
 
-@pytest.mark.skipif(
-    not has_redis_package(),
-    reason="redis package is not installed",
-)
+@requires_redis_package
 def test_redis_load_from_config_passes_all_fields() -> None:
     """load_from_config must forward all RedisConfig fields to the backend."""
     from pydantic import SecretStr
@@ -109,10 +76,7 @@ def test_redis_load_from_config_passes_all_fields() -> None:
         assert kwargs.get("socket_connect_timeout") == 1.5
 
 
-@pytest.mark.skipif(
-    not has_redis_package(),
-    reason="redis package is not installed",
-)
+@requires_redis_package
 def test_redis_config_defaults() -> None:
     """RedisConfig must expose the new fields with sensible defaults."""
     from fastapi_cachex.backends.config import DEFAULT_REDIS_PREFIX
@@ -127,10 +91,7 @@ def test_redis_config_defaults() -> None:
     assert cfg.protocol == 2
 
 
-@pytest.mark.skipif(
-    not has_redis_package(),
-    reason="redis package is not installed",
-)
+@requires_redis_package
 def test_redis_protocol_default_is_resp2() -> None:
     """AsyncRedisCacheBackend must default to protocol=2 (RESP2) for Redis 8.0+ compat.
 
@@ -146,10 +107,7 @@ def test_redis_protocol_default_is_resp2() -> None:
         assert hasattr(backend.client, "connection_pool")
 
 
-@pytest.mark.skipif(
-    not has_redis_package(),
-    reason="redis package is not installed",
-)
+@requires_redis_package
 def test_redis_load_from_config_forwards_protocol() -> None:
     """load_from_config must forward the protocol field from RedisConfig."""
     from fastapi_cachex.backends.config import RedisConfig
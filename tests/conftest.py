@@ -1,9 +1,68 @@
+import asyncio
+import functools
+import socket
+
 import pytest
 import pytest_asyncio
 
 from fastapi_cachex.backends.memory import MemoryBackend
 from fastapi_cachex.proxy import BackendProxy
 
+# uvloop is optional (and unavailable on Windows); when present, run the whole
+# async suite on it for lower per-request scheduler overhead.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # type: ignore[assignment]
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Give pytest-asyncio a uvloop policy when uvloop is installed."""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@functools.lru_cache(maxsize=1)
+def is_redis_running(host: str = "127.0.0.1", port: int = 6379) -> bool:
+    """Check if a Redis server is reachable (probed at most once per session)."""
+    try:
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        s.settimeout(1.0)
+        s.connect((host, port))
+        s.close()
+    except (TimeoutError, ConnectionRefusedError, OSError):
+        return False
+    else:
+        return True
+
+
+@functools.lru_cache(maxsize=1)
+def has_redis_package() -> bool:
+    """Return True if the `redis` package is importable (cached)."""
+    try:
+        import redis.asyncio  # type: ignore[unused-ignore]  # noqa: F401
+
+    except Exception:
+        return False
+    return True
+
+
+# Shared availability marks: evaluated once here instead of re-probing in every
+# module that has Redis-dependent tests.
+REDIS_AVAILABLE = is_redis_running() and has_redis_package()
+
+requires_redis = pytest.mark.skipif(
+    not REDIS_AVAILABLE,
+    reason="Redis is not available",
+)
+
+requires_redis_package = pytest.mark.skipif(
+    not has_redis_package(),
+    reason="redis package is not installed",
+)
+
 
 @pytest_asyncio.fixture
 async def memory_backend():
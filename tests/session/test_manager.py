@@ -617,3 +617,78 @@ async def test_user_agent_binding_with_none_ua_emits_warning(
     assert token
     assert session.user_agent is None
     assert any("user_agent_binding" in msg for msg in caplog.messages)
+
+
+@pytest.mark.asyncio
+async def test_token_cache_hits(backend: MemoryBackend) -> None:
+    """Repeated get_session calls with the same token must skip the backend."""
+    from unittest.mock import AsyncMock
+
+    config = SessionConfig(secret_key="a" * 32, token_cache_size=128)
+    manager = SessionManager(backend, config)
+
+    user = SessionUser(user_id="cache-user")
+    _session, token = await manager.create_session(user=user)
+
+    backend_get = AsyncMock(wraps=backend.get)
+    manager.backend.get = backend_get  # type: ignore[method-assign]
+
+    first, _ = await manager.get_session(token)
+    second, _ = await manager.get_session(token)
+
+    assert second is first
+    assert backend_get.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_token_cache_evicted_on_invalidate(backend: MemoryBackend) -> None:
+    """Invalidating a session must drop its cached token."""
+    config = SessionConfig(secret_key="a" * 32, token_cache_size=128)
+    manager = SessionManager(backend, config)
+
+    user = SessionUser(user_id="cache-user")
+    session, token = await manager.create_session(user=user)
+    await manager.get_session(token)  # populate the cache
+
+    await manager.invalidate_session(session)
+
+    with pytest.raises(SessionInvalidError):
+        await manager.get_session(token)
+
+
+@pytest.mark.asyncio
+async def test_token_cache_evicted_on_delete_user_sessions(
+    backend: MemoryBackend,
+) -> None:
+    """Deleting all of a user's sessions must drop their cached tokens."""
+    config = SessionConfig(secret_key="a" * 32, token_cache_size=128)
+    manager = SessionManager(backend, config)
+
+    user = SessionUser(user_id="cache-user")
+    _session, token = await manager.create_session(user=user)
+    await manager.get_session(token)  # populate the cache
+
+    deleted = await manager.delete_user_sessions("cache-user")
+    assert deleted == 1
+
+    with pytest.raises(SessionNotFoundError):
+        await manager.get_session(token)
+
+
+@pytest.mark.asyncio
+async def test_token_cache_disabled_by_default(
+    manager: SessionManager, backend: MemoryBackend
+) -> None:
+    """With token_cache_size=0 every lookup must hit the backend."""
+    from unittest.mock import AsyncMock
+
+    user = SessionUser(user_id="cache-user")
+    _session, token = await manager.create_session(user=user)
+
+    backend_get = AsyncMock(wraps=backend.get)
+    manager.backend.get = backend_get  # type: ignore[method-assign]
+
+    await manager.get_session(token)
+    await manager.get_session(token)
+
+    assert backend_get.await_count == 2
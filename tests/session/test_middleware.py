@@ -1,8 +1,10 @@
 """Tests for session middleware and token extraction."""
 
+from collections.abc import Callable
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
+from types import SimpleNamespace
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 
@@ -19,160 +21,149 @@ from fastapi_cachex.session.middleware import SessionMiddleware
 from fastapi_cachex.session.models import SessionUser
 
 
-@pytest.fixture
+def make_request(
+    headers: dict[str, str] | None = None,
+    client_host: str | None = None,
+) -> Request:
+    """Build a real `Request` from a minimal ASGI scope.
+
+    Much cheaper than `MagicMock(spec=Request)` (which introspects the whole
+    `Request` class per call) and exercises the production code path.
+    """
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "headers": [
+            (k.lower().encode(), v.encode()) for k, v in (headers or {}).items()
+        ],
+        "client": (client_host, 0) if client_host else None,
+        "app": SimpleNamespace(state=SimpleNamespace()),
+    }
+    return Request(scope)
+
+
+@pytest.fixture(scope="session")
 def config() -> SessionConfig:
-    """Create session config for testing."""
-    return SessionConfig(secret_key="a" * 32)
-
-
-@pytest.fixture
-def manager(config: SessionConfig) -> SessionManager:
-    """Create session manager for testing."""
-    backend = MemoryBackend()
-    return SessionManager(backend, config)
-
+    """Create session config for testing.
 
-def test_middleware_initialization(
-    manager: SessionManager, config: SessionConfig
-) -> None:
-    """Test middleware initialization."""
-
-    # Create a simple ASGI app
-    async def app(scope, receive, send):
-        pass
+    Session-scoped: SessionConfig construction runs full Pydantic validation,
+    so build it once. Tests mutate it only via `monkeypatch` so changes revert.
+    """
+    return SessionConfig(secret_key="a" * 32)
 
-    middleware = SessionMiddleware(app, manager, config)
 
-    assert middleware.session_manager is manager
-    assert middleware.config is config
+@pytest.fixture(scope="module")
+def backend() -> MemoryBackend:
+    """Shared memory backend; cheap to keep around, cheap to reset."""
+    return MemoryBackend()
 
 
-def test_middleware_initialization_uses_manager_config(
-    manager: SessionManager,
-) -> None:
-    """Ensure middleware defaults to manager config when none provided."""
+@pytest.fixture(scope="module")
+def manager(backend: MemoryBackend, config: SessionConfig) -> SessionManager:
+    """Create session manager for testing."""
+    return SessionManager(backend, config)
 
-    async def app(scope, receive, send):
-        pass
 
-    middleware = SessionMiddleware(app, manager)
+@pytest.fixture(autouse=True)
+def _clear_backend(backend: MemoryBackend):
+    """Reset the shared backend so tests stay isolated."""
+    yield
+    backend.cache.clear()
 
-    assert middleware.config is manager.config
 
+@pytest.fixture(scope="session")
+def middleware_factory() -> Callable[[bool], SessionMiddleware]:
+    """Return a callable building (and caching) a middleware per bearer flag.
 
-def test_extract_token_from_header(
-    manager: SessionManager, config: SessionConfig
-) -> None:
-    """Test token extraction from header."""
+    The underlying app/manager/middleware are shared across the session, so
+    parametrized token/IP extraction tests skip per-case construction cost.
+    """
+    cache: dict[bool, SessionMiddleware] = {}
 
     async def app(scope, receive, send):
         pass
 
-    middleware = SessionMiddleware(app, manager, config)
-
-    # Create a mock request with header
-    request = MagicMock(spec=Request)
-    request.headers = {config.header_name: "test-token"}
-
-    token = middleware._extract_token(request)
-    assert token == "test-token"
-
-
-def test_extract_token_from_bearer(
-    manager: SessionManager, config: SessionConfig
+    def factory(use_bearer: bool) -> SessionMiddleware:
+        if use_bearer not in cache:
+            cfg = SessionConfig(secret_key="a" * 32, use_bearer_token=use_bearer)
+            cache[use_bearer] = SessionMiddleware(
+                app, SessionManager(MemoryBackend(), cfg), cfg
+            )
+        return cache[use_bearer]
+
+    return factory
+
+
+@pytest.mark.parametrize(
+    ("headers", "use_bearer", "expected"),
+    [
+        ({"X-Session-Token": "test-token"}, False, "test-token"),
+        ({"authorization": "Bearer test-token"}, True, "test-token"),
+        ({"authorization": "Bearer"}, True, None),  # Malformed: missing token
+        ({}, False, None),
+    ],
+)
+def test_extract_token(
+    middleware_factory: Callable[[bool], SessionMiddleware],
+    headers: dict[str, str],
+    use_bearer: bool,
+    expected: str | None,
 ) -> None:
-    """Test token extraction from Bearer token."""
-
-    async def app(scope, receive, send):
-        pass
-
-    config.use_bearer_token = True
-    middleware = SessionMiddleware(app, manager, config)
-
-    # Create a mock request with Bearer token
-    request = MagicMock(spec=Request)
-    request.headers = {"authorization": "Bearer test-token"}
-
-    token = middleware._extract_token(request)
-    assert token == "test-token"
-
-
-def test_extract_token_none(manager: SessionManager, config: SessionConfig) -> None:
-    """Test token extraction when no token is present."""
-
-    async def app(scope, receive, send):
-        pass
-
-    middleware = SessionMiddleware(app, manager, config)
-
-    # Create a mock request with no token
-    request = MagicMock(spec=Request)
-    request.headers = {}
-
-    token = middleware._extract_token(request)
-    assert token is None
-
-
-def test_get_client_ip_from_x_forwarded_for(
-    manager: SessionManager,
-    config: SessionConfig,
+    """Test token extraction from header, Bearer auth, and missing token."""
+    middleware = middleware_factory(use_bearer)
+    request = make_request(headers=headers)
+
+    assert middleware._extract_token(request) == expected
+
+
+@pytest.mark.parametrize(
+    ("headers", "client_host", "expected_ip"),
+    [
+        ({"x-forwarded-for": "192.168.1.1, 10.0.0.1"}, None, "192.168.1.1"),
+        ({"x-real-ip": "192.168.1.1"}, None, "192.168.1.1"),
+        ({}, "192.168.1.1", "192.168.1.1"),
+        ({}, None, None),
+    ],
+)
+def test_get_client_ip(
+    middleware_factory: Callable[[bool], SessionMiddleware],
+    headers: dict[str, str],
+    client_host: str | None,
+    expected_ip: str | None,
 ) -> None:
-    """Test getting client IP from X-Forwarded-For header."""
-
-    async def app(scope, receive, send):
-        pass
-
-    middleware = SessionMiddleware(app, manager, config)
-
-    # Create a mock request
-    request = MagicMock(spec=Request)
-    request.headers = {"x-forwarded-for": "192.168.1.1, 10.0.0.1"}
-    request.client = None
+    """Test client IP resolution: forwarded headers, direct client, none."""
+    middleware = middleware_factory(False)
+    request = make_request(headers=headers, client_host=client_host)
 
-    ip = middleware._get_client_ip(request)
-    assert ip == "192.168.1.1"
+    assert middleware._get_client_ip(request) == expected_ip
 
 
-def test_get_client_ip_from_real_ip(
-    manager: SessionManager,
-    config: SessionConfig,
+def test_middleware_initialization(
+    manager: SessionManager, config: SessionConfig
 ) -> None:
-    """Test getting client IP from X-Real-IP header."""
+    """Test middleware initialization."""
 
+    # Create a simple ASGI app
     async def app(scope, receive, send):
         pass
 
     middleware = SessionMiddleware(app, manager, config)
 
-    # Create a mock request
-    request = MagicMock(spec=Request)
-    request.headers = {"x-real-ip": "192.168.1.1"}
-    request.client = None
-
-    ip = middleware._get_client_ip(request)
-    assert ip == "192.168.1.1"
+    assert middleware.session_manager is manager
+    assert middleware.config is config
 
 
-def test_get_client_ip_from_client(
+def test_middleware_initialization_uses_manager_config(
     manager: SessionManager,
-    config: SessionConfig,
 ) -> None:
-    """Test getting client IP from client."""
+    """Ensure middleware defaults to manager config when none provided."""
 
     async def app(scope, receive, send):
         pass
 
-    middleware = SessionMiddleware(app, manager, config)
-
-    # Create a mock request
-    request = MagicMock(spec=Request)
-    request.headers = {}
-    client = MagicMock()
-    client.host = "192.168.1.1"
-    request.client = client
+    middleware = SessionMiddleware(app, manager)
 
-    ip = middleware._get_client_ip(request)
-    assert ip == "192.168.1.1"
+    assert middleware.config is manager.config
 
 
 @pytest.mark.asyncio
@@ -268,53 +259,14 @@ async def test_dispatch_sets_session_in_request_state(
     assert response.status_code == 200
 
 
-def test_extract_token_from_bearer_with_malformed_header(
-    manager: SessionManager, config: SessionConfig
-) -> None:
-    """Test token extraction with malformed Bearer header."""
-
-    async def app(scope, receive, send):
-        pass
-
-    config.use_bearer_token = True
-    middleware = SessionMiddleware(app, manager, config)
-
-    # Create a mock request with malformed Bearer token
-    request = MagicMock(spec=Request)
-    request.headers = {"authorization": "Bearer"}  # Missing token
-
-    token = middleware._extract_token(request)
-    assert token is None
-
-
-def test_get_client_ip_none(
-    manager: SessionManager,
-    config: SessionConfig,
-) -> None:
-    """Test getting client IP when none available."""
-
-    async def app(scope, receive, send):
-        pass
-
-    middleware = SessionMiddleware(app, manager, config)
-
-    # Create a mock request with no IP info
-    request = MagicMock(spec=Request)
-    request.headers = {}
-    request.client = None
-
-    ip = middleware._get_client_ip(request)
-    assert ip is None
-
-
 @pytest.mark.asyncio
 async def test_dispatch_with_session_and_ip_binding(
+    manager: SessionManager,
     config: SessionConfig,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test dispatch validates IP binding."""
-    backend = MemoryBackend()
-    manager = SessionManager(backend, config)
-    config.ip_binding = True
+    monkeypatch.setattr(config, "ip_binding", True)
 
     app = FastAPI()
     SessionMiddleware(app, manager, config)
@@ -339,12 +291,12 @@ async def test_dispatch_with_session_and_ip_binding(
 
 @pytest.mark.asyncio
 async def test_dispatch_with_user_agent_binding(
+    manager: SessionManager,
     config: SessionConfig,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test dispatch validates User-Agent binding."""
-    backend = MemoryBackend()
-    manager = SessionManager(backend, config)
-    config.user_agent_binding = True
+    monkeypatch.setattr(config, "user_agent_binding", True)
 
     app = FastAPI()
     SessionMiddleware(app, manager, config)
@@ -383,12 +335,11 @@ async def test_dispatch_direct_call(
     user = SessionUser(user_id="test-user")
     _session, token = await manager.create_session(user=user)
 
-    # Create a mock request
-    request = MagicMock(spec=Request)
-    request.headers = {config.header_name: token, "user-agent": "test-agent"}
-    request.state = MagicMock()
-    request.client = MagicMock()
-    request.client.host = "127.0.0.1"
+    # Create a request
+    request = make_request(
+        headers={config.header_name: token, "user-agent": "test-agent"},
+        client_host="127.0.0.1",
+    )
 
     # Create mock response
     mock_response = MagicMock(spec=Response)
@@ -417,12 +368,11 @@ async def test_dispatch_with_session_error(
 
     middleware = SessionMiddleware(mock_app, manager, config)
 
-    # Create mock request with invalid token
-    request = MagicMock(spec=Request)
-    request.headers = {config.header_name: "invalid-token-xyz"}
-    request.state = MagicMock()
-    request.client = MagicMock()
-    request.client.host = "127.0.0.1"
+    # Create a request with invalid token
+    request = make_request(
+        headers={config.header_name: "invalid-token-xyz"},
+        client_host="127.0.0.1",
+    )
 
     # Create mock response
     mock_response = MagicMock(spec=Response)
@@ -19,8 +19,8 @@ def test_session_user_creation() -> None:
     assert user.user_id == "123"
     assert user.username == "testuser"
     assert user.email == "test@example.com"
-    assert user.roles == []
-    assert user.permissions == []
+    assert user.roles == ()
+    assert user.permissions == ()
 
 
 def test_session_user_with_roles() -> None:
@@ -82,18 +82,14 @@ def test_session_is_expired() -> None:
 
 def test_session_renew() -> None:
     """Test session renewal."""
-    import time
-
     session = Session()
     session.expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
     old_expiry = session.expires_at
 
-    # Sleep briefly to ensure time difference
-    time.sleep(0.01)
-
-    session.renew(3600)  # Renew for 1 hour
+    # Inject a later clock instead of sleeping for a real time difference
+    session.renew(3600, now=datetime.now(timezone.utc) + timedelta(seconds=1))
 
-    assert session.expires_at >= old_expiry
+    assert session.expires_at > old_expiry
 
 
 def test_session_regenerate_id() -> None:
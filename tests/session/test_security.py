@@ -6,6 +6,12 @@ from fastapi_cachex.session.models import Session
 from fastapi_cachex.session.security import SecurityManager
 
 
+@pytest.fixture(scope="session")
+def security_manager() -> SecurityManager:
+    """Shared manager: key validation/derivation only needs to run once."""
+    return SecurityManager("a" * 32)
+
+
 def test_security_manager_initialization() -> None:
     """Test security manager initialization: signing works with a valid key."""
     manager = SecurityManager("a" * 32)
@@ -18,69 +24,62 @@ def test_security_manager_short_key() -> None:
         SecurityManager("short")
 
 
-def test_sign_session_id() -> None:
+def test_sign_session_id(security_manager: SecurityManager) -> None:
     """Test session ID signing."""
-    manager = SecurityManager("a" * 32)
-    signature = manager.sign_session_id("test-session-id")
+    signature = security_manager.sign_session_id("test-session-id")
 
     assert signature is not None
     assert len(signature) == 64  # SHA256 hex digest
 
 
-def test_verify_signature() -> None:
+def test_verify_signature(security_manager: SecurityManager) -> None:
     """Test signature verification."""
-    manager = SecurityManager("a" * 32)
     session_id = "test-session-id"
-    signature = manager.sign_session_id(session_id)
+    signature = security_manager.sign_session_id(session_id)
 
     # Valid signature
-    assert manager.verify_signature(session_id, signature)
+    assert security_manager.verify_signature(session_id, signature)
 
     # Invalid signature
-    assert not manager.verify_signature(session_id, "invalid")
+    assert not security_manager.verify_signature(session_id, "invalid")
 
     # Different session ID
-    assert not manager.verify_signature("different-id", signature)
+    assert not security_manager.verify_signature("different-id", signature)
 
 
-def test_check_ip_match() -> None:
+def test_check_ip_match(security_manager: SecurityManager) -> None:
     """Test IP address matching."""
-    manager = SecurityManager("a" * 32)
-
     # Session without IP binding
     session = Session()
-    assert manager.check_ip_match(session, "192.168.1.1")
-    assert manager.check_ip_match(session, None)
+    assert security_manager.check_ip_match(session, "192.168.1.1")
+    assert security_manager.check_ip_match(session, None)
 
     # Session with IP binding
     session.ip_address = "192.168.1.1"
-    assert manager.check_ip_match(session, "192.168.1.1")
-    assert not manager.check_ip_match(session, "192.168.1.2")
-    assert not manager.check_ip_match(session, None)
+    assert security_manager.check_ip_match(session, "192.168.1.1")
+    assert not security_manager.check_ip_match(session, "192.168.1.2")
+    assert not security_manager.check_ip_match(session, None)
 
 
-def test_check_user_agent_match() -> None:
+def test_check_user_agent_match(security_manager: SecurityManager) -> None:
     """Test User-Agent matching."""
-    manager = SecurityManager("a" * 32)
-
     # Session without UA binding
     session = Session()
-    assert manager.check_user_agent_match(session, "Mozilla/5.0")
-    assert manager.check_user_agent_match(session, None)
+    assert security_manager.check_user_agent_match(session, "Mozilla/5.0")
+    assert security_manager.check_user_agent_match(session, None)
 
     # Session with UA binding
     session.user_agent = "Mozilla/5.0"
-    assert manager.check_user_agent_match(session, "Mozilla/5.0")
-    assert not manager.check_user_agent_match(session, "Chrome/91.0")
-    assert not manager.check_user_agent_match(session, None)
+    assert security_manager.check_user_agent_match(session, "Mozilla/5.0")
+    assert not security_manager.check_user_agent_match(session, "Chrome/91.0")
+    assert not security_manager.check_user_agent_match(session, None)
 
 
-def test_hash_data() -> None:
+def test_hash_data(security_manager: SecurityManager) -> None:
     """Test data hashing."""
-    manager = SecurityManager("a" * 32)
-    hash1 = manager.hash_data("test data")
-    hash2 = manager.hash_data("test data")
-    hash3 = manager.hash_data("different data")
+    hash1 = security_manager.hash_data("test data")
+    hash2 = security_manager.hash_data("test data")
+    hash3 = security_manager.hash_data("different data")
 
     assert hash1 == hash2
     assert hash1 != hash3
@@ -1,9 +1,8 @@
 """Tests for OAuth state manager functionality."""
 
-import hashlib
-import json
-import socket
+import asyncio
 from collections.abc import AsyncGenerator
+from collections.abc import Generator
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
@@ -17,91 +16,100 @@ from fastapi_cachex.backends.memory import MemoryBackend
 from fastapi_cachex.proxy import BackendProxy
 from fastapi_cachex.state.exceptions import InvalidStateError
 from fastapi_cachex.state.exceptions import StateDataError
+from fastapi_cachex.state.manager import DEFAULT_KEY_PREFIX
 from fastapi_cachex.state.manager import StateManager
 from fastapi_cachex.state.models import StateData
 from fastapi_cachex.types import CacheEntry
+from tests.conftest import requires_redis
+
+# Same optional C-serializer pattern as the redis/memcached backends: orjson
+# when available, stdlib json otherwise.
+try:
+    import orjson as json
+
+except ImportError:
+    import json  # type: ignore[no-redef]
+
+# Corrupt backend payloads reused by the parametrized bad-state test. All are
+# compile-time constants so no hashing or serialization runs per test.
+BAD_JSON = b"not valid json"
+NON_UTF8 = b"\xff\xfe non-utf8"
+MISSING_EXPIRY_JSON = (
+    b'{"state": "bad_state", "created_at": "2024-01-01T00:00:00+00:00",'
+    b' "metadata": {"test": "data"}}'
+)
+BAD_EXPIRY_JSON = (
+    b'{"state": "bad_state", "created_at": "2024-01-01T00:00:00+00:00",'
+    b' "expires_at": "invalid-date-format", "metadata": {"test": "data"}}'
+)
 
+# Cache keys for seeded states under the default prefix, built once at import
+BAD_STATE_KEY = f"{DEFAULT_KEY_PREFIX}bad_state"
+TEST_STATE_KEY = f"{DEFAULT_KEY_PREFIX}test_state"
 
-def is_redis_running(host: str = "127.0.0.1", port: int = 6379) -> bool:
-    """Check if Redis server is running."""
-    try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        s.settimeout(1.0)
-        s.connect((host, port))
-        s.close()
-    except (TimeoutError, ConnectionRefusedError, OSError):
-        return False
-    else:
-        return True
+# Shared timestamps for seeded payloads, computed once at import
+_NOW_ISO = datetime.now(timezone.utc).isoformat()
+_FUTURE_ISO = (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
 
 
-def has_redis_package() -> bool:
-    """Return True if the redis package is importable."""
-    try:
-        import redis.asyncio  # type: ignore[unused-ignore]  # noqa: F401
+def _make_state_entry(
+    state: str,
+    *,
+    expires_at: str | None = None,
+    metadata: Any = None,
+) -> CacheEntry:
+    """Serialize a state payload into a CacheEntry, as create_state would.
 
-    except Exception:
-        return False
-    return True
+    Uses the module-level timestamp constants so tests seeding the backend
+    directly don't re-run datetime.now per test.
+    """
+    payload = {
+        "state": state,
+        "created_at": _NOW_ISO,
+        "expires_at": expires_at or _FUTURE_ISO,
+        "metadata": {"test": "data"} if metadata is None else metadata,
+    }
+    body = json.dumps(payload)
+    # orjson returns bytes, stdlib json returns str
+    content = body if isinstance(body, bytes) else body.encode("utf-8")
+    # No test asserts on the fingerprint, so skip hashing the payload
+    return CacheEntry(fingerprint="test-etag", content=content)
 
 
-@pytest_asyncio.fixture
-async def memory_backend_for_state() -> AsyncGenerator[BaseCacheBackend, Any]:
-    """Create a MemoryBackend instance."""
-    backend = MemoryBackend()
-    backend.start_cleanup()
-    yield backend
-    backend.stop_cleanup()
+def _clock_ahead(seconds: int) -> type[datetime]:
+    """Return a datetime replacement whose now() runs `seconds` in the future.
+
+    Monkeypatched into fastapi_cachex.state.manager so expiry tests advance a
+    fake clock instead of sleeping through a real TTL.
+    """
 
+    class _ShiftedDatetime(datetime):
+        @classmethod
+        def now(cls, tz: timezone | None = None) -> datetime:  # type: ignore[override]
+            return datetime.now(tz) + timedelta(seconds=seconds)
 
-@pytest_asyncio.fixture
-async def redis_backend_for_state() -> AsyncGenerator[BaseCacheBackend, Any]:
-    """Create a Redis backend instance if Redis is available."""
-    if not is_redis_running() or not has_redis_package():
-        pytest.skip("Redis server is not running or redis package not installed")
-
-    from fastapi_cachex.backends import AsyncRedisCacheBackend
-
-    backend = AsyncRedisCacheBackend(
-        host="127.0.0.1",
-        port=6379,
-        socket_timeout=1.0,
-        socket_connect_timeout=1.0,
-        key_prefix="test_state:",
-    )
-    yield backend
-    await backend.clear()
+    return _ShiftedDatetime
 
 
-@pytest_asyncio.fixture(
+@pytest.fixture(
+    scope="session",
     params=[
         pytest.param("memory", id="MemoryBackend"),
-        pytest.param(
-            "redis",
-            id="RedisBackend",
-            marks=pytest.mark.skipif(
-                not (is_redis_running() and has_redis_package()),
-                reason="Redis not available",
-            ),
-        ),
-    ]
+        pytest.param("redis", id="RedisBackend", marks=requires_redis),
+    ],
 )
-async def state_manager(
-    request: Any,
-) -> AsyncGenerator[StateManager, Any]:
-    """Create a StateManager instance with different backends.
+def state_backend(request: Any) -> Generator[BaseCacheBackend, Any, None]:
+    """Build one backend per param for the whole session.
 
-    This fixture is parametrized to test with:
-    - MemoryBackend (always runs)
-    - RedisBackend (runs only if Redis is available)
+    Construction (and, for Redis, the connection pool) is amortized across
+    the suite; per-test isolation comes from clearing it in `state_manager`.
+    The memory backend's cleanup task is started lazily on first use and
+    stopped once at session teardown instead of per test.
     """
-    backend_type = request.param
-
-    if backend_type == "memory":
-        mem_backend = MemoryBackend()
-        mem_backend.start_cleanup()
-        backend: BaseCacheBackend = mem_backend
-    else:  # redis
+    backend: BaseCacheBackend
+    if request.param == "memory":
+        backend = MemoryBackend()
+    else:
         from fastapi_cachex.backends import AsyncRedisCacheBackend
 
         backend = AsyncRedisCacheBackend(
@@ -112,18 +120,30 @@ async def state_manager(
             key_prefix="test_state:",
         )
 
-    BackendProxy.set(backend)
-    manager = StateManager()
-
-    yield manager
+    yield backend
 
-    # Cleanup
-    await backend.clear()
-    if backend_type == "memory" and isinstance(backend, MemoryBackend):
+    if isinstance(backend, MemoryBackend):
         backend.stop_cleanup()
 
 
-@pytest.mark.asyncio
+@pytest_asyncio.fixture
+async def state_manager(
+    state_backend: BaseCacheBackend,
+) -> AsyncGenerator[StateManager, Any]:
+    """Create a StateManager instance with different backends.
+
+    This fixture is parametrized (via `state_backend`) to test with:
+    - MemoryBackend (always runs)
+    - RedisBackend (runs only if Redis is available)
+    """
+    BackendProxy.set(state_backend)
+
+    yield StateManager()
+
+    # Cleanup: reset the shared backend between tests
+    await state_backend.clear()
+
+
 async def test_create_state_basic(state_manager: StateManager) -> None:
     """Test creating a basic OAuth state."""
     state = await state_manager.create_state()
@@ -133,7 +153,6 @@ async def test_create_state_basic(state_manager: StateManager) -> None:
     assert len(state) > 0
 
 
-@pytest.mark.asyncio
 async def test_create_state_with_metadata(state_manager: StateManager) -> None:
     """Test creating OAuth state with metadata."""
     metadata = {
@@ -152,7 +171,6 @@ async def test_create_state_with_metadata(state_manager: StateManager) -> None:
     assert retrieved_metadata == metadata
 
 
-@pytest.mark.asyncio
 async def test_create_state_with_custom_ttl(state_manager: StateManager) -> None:
     """Test creating OAuth state with custom TTL."""
     custom_ttl = 1800  # 30 minutes
@@ -164,7 +182,6 @@ async def test_create_state_with_custom_ttl(state_manager: StateManager) -> None
     assert is_valid is True
 
 
-@pytest.mark.asyncio
 async def test_consume_state(state_manager: StateManager) -> None:
     """Test consuming a valid OAuth state."""
     state = await state_manager.create_state()
@@ -183,7 +200,6 @@ async def test_consume_state(state_manager: StateManager) -> None:
     assert is_valid is False
 
 
-@pytest.mark.asyncio
 async def test_consume_state_with_different_manager(
     memory_backend: MemoryBackend,
 ) -> None:
@@ -205,7 +221,6 @@ async def test_consume_state_with_different_manager(
     assert is_valid is False
 
 
-@pytest.mark.asyncio
 async def test_consume_state_with_metadata(state_manager: StateManager) -> None:
     """Test consuming state and retrieving its metadata."""
     metadata = {
@@ -221,37 +236,34 @@ async def test_consume_state_with_metadata(state_manager: StateManager) -> None:
     assert state_data.metadata == metadata
 
 
-@pytest.mark.asyncio
 async def test_consume_invalid_state(state_manager: StateManager) -> None:
     """Test consuming an invalid state raises InvalidStateError."""
     with pytest.raises(InvalidStateError, match="Invalid or expired state"):
         await state_manager.consume_state("invalid_state_string")
 
 
-@pytest.mark.asyncio
-async def test_consume_expired_state(state_manager: StateManager) -> None:
+async def test_consume_expired_state(
+    state_manager: StateManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test consuming an expired state raises an error.
 
-    Different backends behave differently for expired states:
-    - MemoryBackend: InvalidStateError (auto-removes expired entries)
-    - RedisBackend: StateExpiredError (TTL expired but data still exists)
+    Expiry can surface in two ways:
+    - InvalidStateError (backend TTL already dropped the entry)
+    - StateExpiredError (entry still present but logically expired)
     """
     from fastapi_cachex.state.exceptions import StateExpiredError
 
     # Create state with very short TTL
     state = await state_manager.create_state(ttl=1)
 
-    # Wait for state to expire from cache backend
-    import asyncio
-
-    await asyncio.sleep(1.1)
+    # Advance the manager's clock past the TTL instead of sleeping
+    monkeypatch.setattr("fastapi_cachex.state.manager.datetime", _clock_ahead(2))
 
     # Try to consume expired state - should fail with one of these exceptions
     with pytest.raises((InvalidStateError, StateExpiredError)):
         await state_manager.consume_state(state)
 
 
-@pytest.mark.asyncio
 async def test_validate_state(state_manager: StateManager) -> None:
     """Test validating a state without consuming it."""
     state = await state_manager.create_state()
@@ -265,14 +277,12 @@ async def test_validate_state(state_manager: StateManager) -> None:
     assert is_valid_again is True
 
 
-@pytest.mark.asyncio
 async def test_validate_invalid_state(state_manager: StateManager) -> None:
     """Test validating an invalid state."""
     is_valid = await state_manager.validate_state("invalid_state")
     assert is_valid is False
 
 
-@pytest.mark.asyncio
 async def test_get_state_metadata_valid(state_manager: StateManager) -> None:
     """Test retrieving metadata from a valid state."""
     metadata = {"key": "value", "nested": {"data": 123}}
@@ -284,14 +294,12 @@ async def test_get_state_metadata_valid(state_manager: StateManager) -> None:
     assert retrieved == metadata
 
 
-@pytest.mark.asyncio
 async def test_get_state_metadata_invalid(state_manager: StateManager) -> None:
     """Test retrieving metadata from an invalid state."""
     retrieved = await state_manager.get_state_metadata("invalid_state")
     assert retrieved is None
 
 
-@pytest.mark.asyncio
 async def test_delete_state(state_manager: StateManager) -> None:
     """Test manually deleting a state."""
     state = await state_manager.create_state()
@@ -309,21 +317,26 @@ async def test_delete_state(state_manager: StateManager) -> None:
     assert is_valid_after is False
 
 
-@pytest.mark.asyncio
 async def test_multiple_states_independent(state_manager: StateManager) -> None:
     """Test that multiple states are independent."""
     metadata1 = {"user_id": "user1"}
     metadata2 = {"user_id": "user2"}
 
-    state1 = await state_manager.create_state(metadata=metadata1)
-    state2 = await state_manager.create_state(metadata=metadata2)
+    # Independent awaits are gathered so the event loop pipelines the backend
+    # round trips instead of serializing them
+    state1, state2 = await asyncio.gather(
+        state_manager.create_state(metadata=metadata1),
+        state_manager.create_state(metadata=metadata2),
+    )
 
     # States should be different
     assert state1 != state2
 
     # Each state should have its own metadata
-    retrieved1 = await state_manager.get_state_metadata(state1)
-    retrieved2 = await state_manager.get_state_metadata(state2)
+    retrieved1, retrieved2 = await asyncio.gather(
+        state_manager.get_state_metadata(state1),
+        state_manager.get_state_metadata(state2),
+    )
 
     assert retrieved1 == metadata1
     assert retrieved2 == metadata2
@@ -331,14 +344,15 @@ async def test_multiple_states_independent(state_manager: StateManager) -> None:
     # Consuming one shouldn't affect the other
     await state_manager.consume_state(state1)
 
-    is_valid1 = await state_manager.validate_state(state1)
-    is_valid2 = await state_manager.validate_state(state2)
+    is_valid1, is_valid2 = await asyncio.gather(
+        state_manager.validate_state(state1),
+        state_manager.validate_state(state2),
+    )
 
     assert is_valid1 is False
     assert is_valid2 is True
 
 
-@pytest.mark.asyncio
 async def test_state_expiry_information(state_manager: StateManager) -> None:
     """Test that state data contains correct expiry information."""
     ttl = 3600
@@ -355,7 +369,6 @@ async def test_state_expiry_information(state_manager: StateManager) -> None:
     assert abs(time_diff - ttl) < 5  # Allow 5 seconds tolerance
 
 
-@pytest.mark.asyncio
 async def test_state_manager_custom_prefix(memory_backend: MemoryBackend) -> None:
     """Test StateManager with custom key prefix."""
     BackendProxy.set(memory_backend)
@@ -373,7 +386,6 @@ async def test_state_manager_custom_prefix(memory_backend: MemoryBackend) -> Non
     assert is_valid_other is False
 
 
-@pytest.mark.asyncio
 async def test_state_reuse_prevention(state_manager: StateManager) -> None:
     """Test that consumed states cannot be reused."""
     state = await state_manager.create_state()
@@ -386,65 +398,67 @@ async def test_state_reuse_prevention(state_manager: StateManager) -> None:
         await state_manager.consume_state(state)
 
 
-@pytest.mark.asyncio
-async def test_get_state_metadata_after_expire(state_manager: StateManager) -> None:
+async def test_get_state_metadata_after_expire(
+    state_manager: StateManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test retrieving metadata from an expired state."""
     # Create state with very short TTL
     state = await state_manager.create_state(ttl=1, metadata={"test": "data"})
 
-    # Wait for state to expire
-    import asyncio
-
-    await asyncio.sleep(1.1)
+    # Advance the manager's clock past the TTL instead of sleeping
+    monkeypatch.setattr("fastapi_cachex.state.manager.datetime", _clock_ahead(2))
 
     # Try to retrieve metadata - should return None since it's expired
     retrieved = await state_manager.get_state_metadata(state)
     assert retrieved is None
 
 
-@pytest.mark.asyncio
-async def test_consume_state_with_invalid_json(state_manager: StateManager) -> None:
-    """Test consuming state when backend returns invalid JSON."""
-    # Directly set invalid JSON in backend
-    cache_key = f"{state_manager.key_prefix}bad_state"
-    etag = hashlib.sha256(b"not valid json").hexdigest()
-    entry = CacheEntry(fingerprint=etag, content=b"not valid json")
-    await state_manager.backend.set(cache_key, entry, ttl=600)
-
-    # Try to consume - should raise StateDataError
-    with pytest.raises(StateDataError, match="Failed to parse state data"):
-        await state_manager.consume_state("bad_state")
-
-
-@pytest.mark.asyncio
-async def test_get_metadata_with_invalid_json(state_manager: StateManager) -> None:
-    """Test retrieving metadata when backend returns invalid JSON."""
-    # Directly set invalid JSON in backend
-    cache_key = f"{state_manager.key_prefix}bad_state"
-    etag = hashlib.sha256(b"not valid json").hexdigest()
-    entry = CacheEntry(fingerprint=etag, content=b"not valid json")
-    await state_manager.backend.set(cache_key, entry, ttl=600)
-
-    # Try to retrieve metadata - should return None
-    retrieved = await state_manager.get_state_metadata("bad_state")
-    assert retrieved is None
-
+async def _seed_bad_state(manager: StateManager, content: bytes) -> str:
+    """Store a corrupt payload under the manager's prefix and return its state."""
+    state = "bad_state"
+    # Fingerprint is never checked on these paths; a dummy value is enough
+    entry = CacheEntry(fingerprint="test", content=content)
+    await manager.backend.set(BAD_STATE_KEY, entry, ttl=600)
+    return state
+
+
+@pytest.mark.parametrize(
+    ("content", "op", "expected"),
+    [
+        pytest.param(BAD_JSON, "consume", "Failed to parse state data", id="invalid-json-consume"),
+        pytest.param(BAD_JSON, "validate", False, id="invalid-json-validate"),
+        pytest.param(BAD_JSON, "metadata", None, id="invalid-json-metadata"),
+        pytest.param(NON_UTF8, "consume", "Unexpected state data format", id="non-utf8-consume"),
+        pytest.param(NON_UTF8, "validate", False, id="non-utf8-validate"),
+        pytest.param(NON_UTF8, "metadata", None, id="non-utf8-metadata"),
+        pytest.param(MISSING_EXPIRY_JSON, "consume", None, id="missing-expiry-consume"),
+        pytest.param(BAD_EXPIRY_JSON, "consume", "Invalid state data structure", id="bad-expiry-consume"),
+        pytest.param(BAD_EXPIRY_JSON, "validate", False, id="bad-expiry-validate"),
+        pytest.param(BAD_EXPIRY_JSON, "metadata", None, id="bad-expiry-metadata"),
+    ],
+)
+async def test_bad_state_data_in_backend(
+    state_manager: StateManager,
+    content: bytes,
+    op: str,
+    expected: str | bool | None,
+) -> None:
+    """Corrupt backend payloads: consume raises, validate/metadata degrade.
 
-@pytest.mark.asyncio
-async def test_validate_state_with_invalid_json(state_manager: StateManager) -> None:
-    """Test validating state when backend returns invalid JSON."""
-    # Directly set invalid JSON in backend
-    cache_key = f"{state_manager.key_prefix}bad_state"
-    etag = hashlib.sha256(b"not valid json").hexdigest()
-    entry = CacheEntry(fingerprint=etag, content=b"not valid json")
-    await state_manager.backend.set(cache_key, entry, ttl=600)
+    Covers invalid JSON, non-UTF-8 bytes, and missing/invalid expiry fields
+    across consume_state, validate_state and get_state_metadata.
+    """
+    state = await _seed_bad_state(state_manager, content)
 
-    # Try to validate - should return False
-    is_valid = await state_manager.validate_state("bad_state")
-    assert is_valid is False
+    if op == "consume":
+        with pytest.raises(StateDataError, match=expected):
+            await state_manager.consume_state(state)
+    elif op == "validate":
+        assert await state_manager.validate_state(state) is expected
+    else:
+        assert await state_manager.get_state_metadata(state) is expected
 
 
-@pytest.mark.asyncio
 async def test_create_state_empty_metadata(state_manager: StateManager) -> None:
     """Test creating state with empty metadata."""
     state = await state_manager.create_state(metadata={})
@@ -454,7 +468,6 @@ async def test_create_state_empty_metadata(state_manager: StateManager) -> None:
     assert metadata == {}
 
 
-@pytest.mark.asyncio
 async def test_state_with_complex_nested_metadata(state_manager: StateManager) -> None:
     """Test state with complex nested metadata structures."""
     complex_metadata = {
@@ -475,22 +488,12 @@ async def test_state_with_complex_nested_metadata(state_manager: StateManager) -
     assert retrieved == complex_metadata
 
 
-@pytest.mark.asyncio
 async def test_get_metadata_with_missing_expiry(state_manager: StateManager) -> None:
     """Test retrieving metadata when state data is missing expiry."""
     state = "test_state"
-    cache_key = f"{state_manager.key_prefix}{state}"
+    cache_key = TEST_STATE_KEY
 
-    # Create StateData with default expires_at
-    state_data_obj = StateData(
-        state=state,
-        metadata={"test": "data"},
-        expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
-    )
-
-    json_content = json.dumps(state_data_obj.model_dump(mode="json"))
-    etag = hashlib.sha256(json_content.encode()).hexdigest()
-    entry = CacheEntry(fingerprint=etag, content=json_content.encode("utf-8"))
+    entry = _make_state_entry(state)
     await state_manager.backend.set(cache_key, entry, ttl=600)
 
     # Should still work and return metadata
@@ -498,21 +501,12 @@ async def test_get_metadata_with_missing_expiry(state_manager: StateManager) ->
     assert retrieved == {"test": "data"}
 
 
-@pytest.mark.asyncio
 async def test_validate_state_with_missing_expiry(state_manager: StateManager) -> None:
     """Test validating state when state data is missing expiry."""
     state = "test_state"
-    cache_key = f"{state_manager.key_prefix}{state}"
-
-    state_data_obj = StateData(
-        state=state,
-        metadata={"test": "data"},
-        expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
-    )
+    cache_key = TEST_STATE_KEY
 
-    json_content = json.dumps(state_data_obj.model_dump(mode="json"))
-    etag = hashlib.sha256(json_content.encode()).hexdigest()
-    entry = CacheEntry(fingerprint=etag, content=json_content.encode("utf-8"))
+    entry = _make_state_entry(state)
     await state_manager.backend.set(cache_key, entry, ttl=600)
 
     # Should validate as valid
@@ -520,137 +514,12 @@ async def test_validate_state_with_missing_expiry(state_manager: StateManager) -
     assert is_valid is True
 
 
-@pytest.mark.asyncio
-async def test_validate_state_with_invalid_expiry_format(
-    state_manager: StateManager,
-) -> None:
-    """Test validating state when expires_at has invalid format."""
-    state = "test_state"
-    cache_key = f"{state_manager.key_prefix}{state}"
-
-    # Manually construct invalid state data
-    state_data = {
-        "state": state,
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "expires_at": "invalid-date-format",
-        "metadata": {"test": "data"},
-    }
-    json_content = json.dumps(state_data)
-    etag = hashlib.sha256(json_content.encode()).hexdigest()
-    entry = CacheEntry(fingerprint=etag, content=json_content.encode("utf-8"))
-    await state_manager.backend.set(cache_key, entry, ttl=600)
-
-    # Should return False due to invalid expiry
-    is_valid = await state_manager.validate_state(state)
-    assert is_valid is False
-
-
-@pytest.mark.asyncio
-async def test_get_metadata_with_invalid_expiry_format(
-    state_manager: StateManager,
-) -> None:
-    """Test retrieving metadata when expires_at has invalid format."""
-    state = "test_state"
-    cache_key = f"{state_manager.key_prefix}{state}"
-
-    # Manually construct invalid state data
-    state_data = {
-        "state": state,
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "expires_at": "invalid-date-format",
-        "metadata": {"test": "data"},
-    }
-    json_content = json.dumps(state_data)
-    etag = hashlib.sha256(json_content.encode()).hexdigest()
-    entry = CacheEntry(fingerprint=etag, content=json_content.encode("utf-8"))
-    await state_manager.backend.set(cache_key, entry, ttl=600)
-
-    # Should return None due to invalid expiry
-    retrieved = await state_manager.get_state_metadata(state)
-    assert retrieved is None
-
-
-@pytest.mark.asyncio
-async def test_consume_state_with_missing_expiry(state_manager: StateManager) -> None:
-    """Test consuming state when state data is missing expiry."""
-    state = "test_state"
-    cache_key = f"{state_manager.key_prefix}{state}"
-
-    # Manually construct state data without expires_at
-    state_data = {
-        "state": state,
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "metadata": {"test": "data"},
-    }
-    json_content = json.dumps(state_data)
-    etag = hashlib.sha256(json_content.encode()).hexdigest()
-    entry = CacheEntry(fingerprint=etag, content=json_content.encode("utf-8"))
-    await state_manager.backend.set(cache_key, entry, ttl=600)
-
-    with pytest.raises(StateDataError):
-        await state_manager.consume_state(state)
-
-
-@pytest.mark.asyncio
-async def test_consume_state_with_non_string_content(
-    state_manager: StateManager,
-) -> None:
-    """Test consuming state when backend content is not a string."""
-    # Directly set non-string content in backend
-    cache_key = f"{state_manager.key_prefix}bad_state"
-    # CacheEntry with non-string content (testing edge case)
-    entry = CacheEntry(fingerprint="test", content=b"\xff\xfe non-utf8")
-    await state_manager.backend.set(cache_key, entry, ttl=600)
-
-    # Try to consume - should raise StateDataError
-    with pytest.raises(StateDataError, match="Unexpected state data format"):
-        await state_manager.consume_state("bad_state")
-
-
-@pytest.mark.asyncio
-async def test_validate_state_with_non_string_content(
-    state_manager: StateManager,
-) -> None:
-    """Test validating state when backend content is not a string."""
-    cache_key = f"{state_manager.key_prefix}bad_state"
-    entry = CacheEntry(fingerprint="test", content=b"\xff\xfe non-utf8")
-    await state_manager.backend.set(cache_key, entry, ttl=600)
-
-    # Try to validate - should return False
-    is_valid = await state_manager.validate_state("bad_state")
-    assert is_valid is False
-
-
-@pytest.mark.asyncio
-async def test_get_metadata_with_non_string_content(
-    state_manager: StateManager,
-) -> None:
-    """Test retrieving metadata when backend content is not a string."""
-    cache_key = f"{state_manager.key_prefix}bad_state"
-    entry = CacheEntry(fingerprint="test", content=b"\xff\xfe non-utf8")
-    await state_manager.backend.set(cache_key, entry, ttl=600)
-
-    # Try to retrieve metadata - should return None
-    retrieved = await state_manager.get_state_metadata("bad_state")
-    assert retrieved is None
-
-
-@pytest.mark.asyncio
 async def test_get_metadata_with_non_dict_metadata(state_manager: StateManager) -> None:
     """Test retrieving metadata when metadata is not a dict."""
     state = "test_state"
-    cache_key = f"{state_manager.key_prefix}{state}"
+    cache_key = TEST_STATE_KEY
 
-    # Manually construct state data with invalid metadata
-    state_data = {
-        "state": state,
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "expires_at": (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat(),
-        "metadata": "not a dict",  # Invalid metadata type
-    }
-    json_content = json.dumps(state_data)
-    etag = hashlib.sha256(json_content.encode()).hexdigest()
-    entry = CacheEntry(fingerprint=etag, content=json_content.encode("utf-8"))
+    entry = _make_state_entry(state, metadata="not a dict")  # Invalid metadata type
     await state_manager.backend.set(cache_key, entry, ttl=600)
 
     # Should return None since metadata validation fails
@@ -658,35 +527,11 @@ async def test_get_metadata_with_non_dict_metadata(state_manager: StateManager)
     assert retrieved is None
 
 
-@pytest.mark.asyncio
-async def test_consume_state_with_bad_expiry_date(state_manager: StateManager) -> None:
-    """Test consuming state when expiry date has invalid format."""
-    state = "test_state"
-    cache_key = f"{state_manager.key_prefix}{state}"
-
-    # Manually construct state data with invalid expiry
-    state_data = {
-        "state": state,
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "expires_at": "bad-date",
-        "metadata": {},
-    }
-    json_content = json.dumps(state_data)
-    etag = hashlib.sha256(json_content.encode()).hexdigest()
-    entry = CacheEntry(fingerprint=etag, content=json_content.encode("utf-8"))
-    await state_manager.backend.set(cache_key, entry, ttl=600)
-
-    # Should raise StateDataError due to bad expiry format
-    with pytest.raises(StateDataError, match="Invalid state data structure"):
-        await state_manager.consume_state(state)
-
-
 # ---------------------------------------------------------------------------
 # New tests for fixes applied in this session
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_delete_state_nonexistent_returns_false(
     state_manager: StateManager,
 ) -> None:
@@ -695,7 +540,6 @@ async def test_delete_state_nonexistent_returns_false(
     assert result is False
 
 
-@pytest.mark.asyncio
 async def test_delete_state_existing_returns_true(
     state_manager: StateManager,
 ) -> None:
@@ -708,7 +552,6 @@ async def test_delete_state_existing_returns_true(
     assert is_valid is False
 
 
-@pytest.mark.asyncio
 async def test_delete_state_idempotent_returns_false_on_second_call(
     state_manager: StateManager,
 ) -> None:
@@ -718,7 +561,6 @@ async def test_delete_state_idempotent_returns_false_on_second_call(
     assert await state_manager.delete_state(state) is False
 
 
-@pytest.mark.asyncio
 async def test_state_manager_accepts_explicit_backend() -> None:
     """StateManager(backend=...) must use the provided backend without touching BackendProxy."""
     backend = MemoryBackend()
@@ -740,7 +582,6 @@ async def test_state_manager_accepts_explicit_backend() -> None:
         await backend.clear()
 
 
-@pytest.mark.asyncio
 async def test_state_manager_falls_back_to_backend_proxy(
     memory_backend: MemoryBackend,
 ) -> None:
@@ -6,9 +6,9 @@ This module tests the actual cache hit performance improvements:
 - Verify TTL-based cache hits return the cached content
 """
 
-import asyncio
-import time
+from collections.abc import Generator
 
+import pytest
 from fastapi import FastAPI
 from fastapi import Response
 from fastapi.testclient import TestClient
@@ -16,28 +16,72 @@ from fastapi.testclient import TestClient
 from fastapi_cachex.cache import cache
 
 app = FastAPI()
-client = TestClient(app)
 
+# Routes exercised by the parametrized cache-hit test below: (path, ttl).
+# Each path gets its own execution counter in _hit_counts.
+_CACHE_HIT_ROUTES = [
+    ("/cached-response", 60),
+    ("/host-specific", 60),
+    ("/ttl-cache-hit", 30),
+]
 
-def test_cache_hit_returns_200_with_cached_content():
-    """Test that cache hit returns 200 OK with cached content directly.
+_hit_counts: dict[str, int] = {}
+_method_counts = {"get": 0, "post": 0}
 
-    This is the critical fix: when TTL cache hits, return the cached response
-    with status 200, not 304. This avoids re-executing the handler function.
-    """
-    call_count = {"value": 0}
 
-    @app.get("/cached-response")
-    @cache(ttl=60)
-    async def get_cached():
-        call_count["value"] += 1
+def _make_endpoint(path: str):
+    """Build a counting handler for the given path."""
+
+    async def endpoint() -> Response:
+        _hit_counts[path] += 1
         return Response(
-            content=f'{{"count": {call_count["value"]}}}',
+            content=f'{{"count": {_hit_counts[path]}}}',
             media_type="application/json",
         )
 
+    return endpoint
+
+
+async def _method_get():
+    _method_counts["get"] += 1
+    return {"method": "GET", "count": _method_counts["get"]}
+
+
+async def _method_post():
+    _method_counts["post"] += 1
+    return {"method": "POST", "count": _method_counts["post"]}
+
+
+@pytest.fixture(scope="module")
+def client() -> Generator[TestClient, None, None]:
+    """Share one TestClient and one route table across the module.
+
+    Routes are registered here once, so Starlette rebuilds its router a single
+    time instead of once per test, and entering the context manager keeps a
+    single portal (and transport) alive for every request instead of spinning
+    one up per call.
+    """
+    for path, ttl in _CACHE_HIT_ROUTES:
+        _hit_counts[path] = 0
+        app.add_api_route(path, cache(ttl=ttl)(_make_endpoint(path)), methods=["GET"])
+
+    app.add_api_route("/method-specific", cache(ttl=60)(_method_get), methods=["GET"])
+    app.add_api_route("/method-specific", cache(ttl=60)(_method_post), methods=["POST"])
+
+    with TestClient(app) as shared_client:
+        yield shared_client
+
+
+@pytest.mark.parametrize(("path", "ttl"), _CACHE_HIT_ROUTES)
+def test_cache_hit_returns_cached_content(client, path, ttl):
+    """Test that a TTL cache hit returns 200 OK with cached content directly.
+
+    This is the critical fix: when TTL cache hits, return the cached response
+    with status 200, not 304, without re-executing the handler function — and
+    without requiring the client to send If-None-Match.
+    """
     # First request - should execute function and cache
-    response1 = client.get("/cached-response")
+    response1 = client.get(path)
     assert response1.status_code == 200
     assert response1.json() == {"count": 1}
     etag1 = response1.headers.get("ETag")
@@ -45,48 +89,15 @@ def test_cache_hit_returns_200_with_cached_content():
 
     # Second request with cached content - should return 200 with same data
     # WITHOUT executing the function again
-    response2 = client.get("/cached-response")
+    response2 = client.get(path)
     assert response2.status_code == 200
     assert response2.json() == {"count": 1}  # Same as first, not incremented to 2
     assert response2.headers.get("ETag") == etag1
-    assert call_count["value"] == 1  # Function only called once
+    assert _hit_counts[path] == 1  # Function only called once
 
 
-def test_cache_key_includes_host():
-    """Test that cache keys include host to avoid cross-host pollution."""
-
-    @app.get("/host-specific")
-    @cache(ttl=60)
-    async def get_host_specific():
-        return {"data": "test"}
-
-    # Request with one host
-    response1 = client.get("/host-specific")
-    assert response1.status_code == 200
-    assert response1.json() == {"data": "test"}
-
-    # Verify cache key structure includes host
-    # (by checking that we get cached content when host matches)
-    response2 = client.get("/host-specific")
-    assert response2.status_code == 200
-
-
-def test_cache_key_includes_method():
+def test_cache_key_includes_method(client):
     """Test that cache keys include HTTP method to avoid GET/POST pollution."""
-    execution_log = {"get": 0, "post": 0}
-
-    @app.get("/method-specific")
-    @cache(ttl=60)
-    async def get_method_get():
-        execution_log["get"] += 1
-        return {"method": "GET", "count": execution_log["get"]}
-
-    @app.post("/method-specific")
-    @cache(ttl=60)
-    async def post_method_post():
-        execution_log["post"] += 1
-        return {"method": "POST", "count": execution_log["post"]}
-
     # GET request
     response_get = client.get("/method-specific")
     assert response_get.status_code == 200
@@ -104,37 +115,7 @@ def test_cache_key_includes_method():
     assert response_get2.json() == {"method": "GET", "count": 1}  # Still 1, cached
 
 
-def test_ttl_cache_hit_without_etag_header():
-    """Test that TTL-based cache hit works even without If-None-Match header.
-
-    The improvement: when ttl is set and cache is valid, return cached content
-    with 200 status without requiring client to send If-None-Match.
-    """
-    execution_count = {"value": 0}
-
-    @app.get("/ttl-cache-hit")
-    @cache(ttl=30)
-    async def ttl_endpoint():
-        execution_count["value"] += 1
-        return Response(
-            content=f'{{"execution": {execution_count["value"]}}}',
-            media_type="application/json",
-        )
-
-    # First request
-    response1 = client.get("/ttl-cache-hit")
-    assert response1.status_code == 200
-    assert response1.json() == {"execution": 1}
-
-    # Second request without If-None-Match header
-    # Should return cached content with 200 OK
-    response2 = client.get("/ttl-cache-hit")
-    assert response2.status_code == 200
-    assert response2.json() == {"execution": 1}  # Cached, not re-executed
-    assert execution_count["value"] == 1
-
-
-def test_no_cache_still_returns_304_on_etag_match():
+def test_no_cache_still_returns_304_on_etag_match(client):
     """Test that no-cache directive still returns 304 when ETag matches.
 
     no-cache with If-None-Match should return 304 (revalidate behavior).
@@ -168,7 +149,7 @@ def test_no_cache_still_returns_304_on_etag_match():
     assert execution_count["value"] == 2  # Function called again due to no-cache
 
 
-def test_cache_key_separates_query_params():
+def test_cache_key_separates_query_params(client):
     """Test that different query parameters result in separate cache entries."""
     call_log = []
 
@@ -197,7 +178,7 @@ def test_cache_key_separates_query_params():
     assert len(call_log) == 2
 
 
-def test_cache_hit_preserves_headers():
+def test_cache_hit_preserves_headers(client):
     """Test that cache hit preserves important headers (Cache-Control, ETag, etc)."""
 
     @app.get("/header-preservation")
@@ -221,35 +202,32 @@ def test_cache_hit_preserves_headers():
     assert "max-age=60" in cache_control1
 
 
-def test_cache_hit_performance():
+def test_cache_hit_performance(client):
     """Test that cache hits don't re-execute the function.
 
-    This is a performance test to ensure cached content is returned directly.
+    Counting executions proves the cached response is served directly; no
+    sleep or wall-clock timing is needed for that invariant.
     """
+    call_count = {"value": 0}
 
     @app.get("/expensive-operation")
     @cache(ttl=60)
     async def expensive_operation():
-        # Simulate expensive operation
-        await asyncio.sleep(0.1)
+        call_count["value"] += 1
         return {"expensive": "data"}
 
     # First request (will execute the expensive operation)
-    start = time.time()
     response1 = client.get("/expensive-operation")
-    time1 = time.time() - start
     assert response1.status_code == 200
-    assert time1 > 0.1  # Should take at least 0.1s due to sleep
+    assert call_count["value"] == 1
 
-    # Second request (should be much faster due to cache hit)
-    start = time.time()
+    # Second request (served from cache without re-executing the handler)
     response2 = client.get("/expensive-operation")
-    time2 = time.time() - start
     assert response2.status_code == 200
-    assert time2 < 0.05  # Should be much faster, no sleep
+    assert call_count["value"] == 1
 
 
-def test_cache_differentiation_by_content_type():
+def test_cache_differentiation_by_content_type(client):
     """Test that cache keys properly differentiate requests.
 
     Although current implementation doesn't include Accept header in cache key,
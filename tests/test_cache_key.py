@@ -1,5 +1,6 @@
 """Tests for cache key generation and parsing."""
 
+import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
@@ -10,22 +11,62 @@ from fastapi_cachex.routes import _parse_cache_key
 from fastapi_cachex.types import CACHE_KEY_SEPARATOR
 
 
-class TestCacheKeyGeneration:
-    """Test cache key generation with various host formats."""
+@pytest.fixture(scope="module")
+def key_app() -> FastAPI:
+    """Build one app with a cached catch-all route for the key tests."""
+    app = FastAPI()
 
-    def test_cache_key_with_host_and_port(self):
-        """Test cache key generation with host containing port number (e.g., 127.0.0.1:8000)."""
-        app = FastAPI()
-        backend = MemoryBackend()
-        BackendProxy.set(backend)
+    @app.get("/{path:path}")
+    @cache(ttl=60)
+    async def catch_all(path: str):
+        return {"data": "test"}
+
+    return app
 
-        @app.get("/api/test")
-        @cache(ttl=60)
-        async def test_endpoint():
-            return {"data": "test"}
 
-        client = TestClient(app, base_url="http://127.0.0.1:8000")
-        response = client.get("/api/test")
+@pytest.fixture
+def backend() -> MemoryBackend:
+    """Fresh backend per test so cache-key assertions see only their entry."""
+    backend = MemoryBackend()
+    BackendProxy.set(backend)
+    return backend
+
+
+class TestCacheKeyGeneration:
+    """Test cache key generation with various host formats."""
+
+    @pytest.mark.parametrize(
+        ("base_url", "path", "query", "expected_host"),
+        [
+            pytest.param(
+                "http://127.0.0.1:8000",
+                "/api/test",
+                "",
+                "127.0.0.1:8000",
+                id="host-with-port",
+            ),
+            pytest.param(
+                "http://localhost:8080",
+                "/api/users",
+                "",
+                "localhost:8080",
+                id="localhost",
+            ),
+            pytest.param(
+                "http://127.0.0.1:8000",
+                "/api/search",
+                "q=test",
+                "127.0.0.1:8000",
+                id="query-params",
+            ),
+        ],
+    )
+    def test_cache_key_components(
+        self, key_app, backend, base_url, path, query, expected_host
+    ):
+        """Cache keys must carry method, host (with port), path and query."""
+        client = TestClient(key_app, base_url=base_url)
+        response = client.get(f"{path}?{query}" if query else path)
 
         assert response.status_code == 200
 
@@ -38,64 +79,12 @@ class TestCacheKeyGeneration:
         assert CACHE_KEY_SEPARATOR in cache_key
 
         # Parse the cache key to verify components
-        method, host, path, query_params = _parse_cache_key(cache_key)
-
-        assert method == "GET"
-        assert host == "127.0.0.1:8000"  # Port should be part of host
-        assert path == "/api/test"
-        assert query_params == ""
-
-    def test_cache_key_with_localhost(self):
-        """Test cache key generation with localhost."""
-        app = FastAPI()
-        backend = MemoryBackend()
-        BackendProxy.set(backend)
-
-        @app.get("/api/users")
-        @cache(ttl=60)
-        async def users_endpoint():
-            return {"users": []}
-
-        client = TestClient(app, base_url="http://localhost:8080")
-        response = client.get("/api/users")
-
-        assert response.status_code == 200
-
-        cache_keys = list(backend.cache.keys())
-        assert len(cache_keys) == 1
-
-        method, host, path, query_params = _parse_cache_key(cache_keys[0])
+        method, host, parsed_path, query_params = _parse_cache_key(cache_key)
 
         assert method == "GET"
-        assert host == "localhost:8080"
-        assert path == "/api/users"
-        assert query_params == ""
-
-    def test_cache_key_with_query_params(self):
-        """Test cache key generation with query parameters."""
-        app = FastAPI()
-        backend = MemoryBackend()
-        BackendProxy.set(backend)
-
-        @app.get("/api/search")
-        @cache(ttl=60)
-        async def search_endpoint(q: str = ""):
-            return {"query": q}
-
-        client = TestClient(app, base_url="http://127.0.0.1:8000")
-        response = client.get("/api/search?q=test")
-
-        assert response.status_code == 200
-
-        cache_keys = list(backend.cache.keys())
-        assert len(cache_keys) == 1
-
-        method, host, path, query_params = _parse_cache_key(cache_keys[0])
-
-        assert method == "GET"
-        assert host == "127.0.0.1:8000"
-        assert path == "/api/search"
-        assert query_params == "q=test"
+        assert host == expected_host
+        assert parsed_path == path
+        assert query_params == query
 
     def test_cache_key_with_ipv6_address(self):
         """Test cache key parsing with IPv6 address containing colons."""
@@ -152,15 +141,6 @@ class TestCacheKeyParsing:
         assert path == ""
         assert query_params == ""
 
-    def test_cache_key_separator_constant(self):
-        """Test that CACHE_KEY_SEPARATOR constant is correctly defined."""
-        assert CACHE_KEY_SEPARATOR == "|||"
-        # Verify it doesn't conflict with common URL characters
-        assert ":" not in CACHE_KEY_SEPARATOR
-        assert "/" not in CACHE_KEY_SEPARATOR
-        assert "?" not in CACHE_KEY_SEPARATOR
-        assert "&" not in CACHE_KEY_SEPARATOR
-
 
 class TestCacheKeyDifferentiation:
     """Test that different requests generate different cache keys."""
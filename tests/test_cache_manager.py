@@ -1,7 +1,6 @@
 """Tests for CacheManager application-level caching."""
 
 import asyncio
-import socket
 from collections.abc import AsyncGenerator
 from typing import TYPE_CHECKING
 from typing import Any
@@ -16,45 +15,16 @@ from fastapi_cachex.manager import CacheManager
 from fastapi_cachex.manager_proxy import CacheManagerProxy
 from fastapi_cachex.proxy import BackendProxy
 from fastapi_cachex.types import CacheEntry
+from tests.conftest import requires_redis
 
 if TYPE_CHECKING:
     from fastapi_cachex.backends.base import BaseCacheBackend
 
 
-def is_redis_running(host: str = "127.0.0.1", port: int = 6379) -> bool:
-    """Check if Redis server is running."""
-    try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        s.settimeout(1.0)
-        s.connect((host, port))
-        s.close()
-    except (TimeoutError, ConnectionRefusedError, OSError):
-        return False
-    else:
-        return True
-
-
-def has_redis_package() -> bool:
-    """Return True if the redis package is importable."""
-    try:
-        import redis.asyncio  # type: ignore[unused-ignore]  # noqa: F401
-
-    except Exception:
-        return False
-    return True
-
-
 @pytest_asyncio.fixture(
     params=[
         pytest.param("memory", id="MemoryBackend"),
-        pytest.param(
-            "redis",
-            id="RedisBackend",
-            marks=pytest.mark.skipif(
-                not (is_redis_running() and has_redis_package()),
-                reason="Redis not available",
-            ),
-        ),
+        pytest.param("redis", id="RedisBackend", marks=requires_redis),
     ]
 )
 async def cache_manager(request: Any) -> AsyncGenerator[CacheManager, Any]:
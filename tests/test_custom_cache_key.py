@@ -172,7 +172,7 @@ def test_default_key_builder_function() -> None:
     mock_request.method = "GET"
     mock_request.headers = {"host": "example.com"}
     mock_request.url.path = "/api/items"
-    mock_request.query_params = "page=1&limit=10"
+    mock_request.url.query = "page=1&limit=10"
 
     # Generate cache key
     cache_key = default_key_builder(mock_request)
@@ -191,7 +191,7 @@ def test_default_key_builder_without_host() -> None:
     mock_request.method = "GET"
     mock_request.headers = {}
     mock_request.url.path = "/api/items"
-    mock_request.query_params = ""
+    mock_request.url.query = ""
 
     # Generate cache key
     cache_key = default_key_builder(mock_request)